@@ -3,28 +3,107 @@
 # This software is released under the MIT License.
 # See the LICENSE file for the full text.
 
+# Heavy GUI/plotting dependencies (matplotlib, PIL, pystray) are imported
+# lazily at first use so the window appears as soon as possible.
 import psutil
 import time
 import tkinter as tk
 from tkinter import ttk, colorchooser, messagebox
-import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from PIL import Image, ImageDraw, ImageTk
-from pystray import MenuItem as item, Icon
+import numpy as np
 import threading
+import functools
+from queue import Queue
 import sys
 import os
-from collections import deque, defaultdict
-from queue import Queue
 import webbrowser
 import datetime
 import csv
+from collections import namedtuple
+
+# Minimal per-NIC counters, attribute-compatible with psutil's where we use them
+_NicCounters = namedtuple('_NicCounters', ['bytes_recv', 'bytes_sent'])
+
+# Optional io_uring-backed CSV appender on Linux: a whole batch of rows
+# enters the kernel with one submit instead of one blocking write each.
+_HAS_LIBURING = False
+if sys.platform.startswith('linux'):
+    try:
+        import liburing
+        _HAS_LIBURING = True
+    except ImportError:
+        pass
+
+
+class _UringAppender:
+    # Append-only writer that submits batched writes through io_uring and
+    # harvests completions lazily on the next write; close() drains the ring.
+    def __init__(self, path, queue_depth=8):
+        self.fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self.ring = liburing.io_uring()
+        liburing.io_uring_queue_init(queue_depth, self.ring)
+        self._in_flight = []  # Buffers stay referenced until their CQE is seen
+
+    def write(self, data):
+        self._reap()
+        buf = bytearray(data)
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        liburing.io_uring_prep_write(sqe, self.fd, buf, len(buf), -1)
+        liburing.io_uring_submit(self.ring)  # Fire and forget; don't wait here
+        self._in_flight.append(buf)
+
+    def _reap(self, wait=False):
+        cqe = liburing.io_uring_cqe()
+        while self._in_flight:
+            if wait:
+                liburing.io_uring_wait_cqe(self.ring, cqe)
+            else:
+                try:
+                    liburing.io_uring_peek_cqe(self.ring, cqe)
+                except BlockingIOError:
+                    break
+            liburing.io_uring_cqe_seen(self.ring, cqe)
+            self._in_flight.pop(0)
+
+    def close(self):
+        self._reap(wait=True)
+        liburing.io_uring_queue_exit(self.ring)
+        os.close(self.fd)
+
+@functools.lru_cache(maxsize=1)
+def _load_tray_image(fallback_color="#00ff00"):
+    # pystray needs a PIL image; load the prebuilt PNG once and cache it so
+    # repeated tray setups never re-read or redraw it
+    from PIL import Image, ImageDraw
+    try:
+        return Image.open("icon.png").convert("RGBA")
+    except (FileNotFoundError, OSError):
+        image = Image.new('RGB', (64, 64), (42, 42, 42))
+        draw = ImageDraw.Draw(image)
+        draw.ellipse((16, 16, 48, 48), fill=fallback_color)
+        return image
+
+
+_BYTE_UNITS = ('Bytes', 'KB', 'MB', 'GB', 'TB')
+
+
+@functools.lru_cache(maxsize=4096)
+def format_bytes(bytes_val):
+    # The daily counters repeat between ticks on an idle link, so the cache
+    # hits often; the unit tier comes from bit_length instead of a divide loop
+    bytes_val = int(bytes_val)
+    tier = min(4, max(0, (bytes_val.bit_length() - 1) // 10))
+    return f"{bytes_val / (1 << (tier * 10)):.2f} {_BYTE_UNITS[tier]}"
+
+
+_SPEED_UNITS = ('KB/s', 'MB/s', 'GB/s')
+_SPEED_DIVS = np.array([1.0, 1024.0, 1024.0 * 1024.0])
+
+
+def _fmt_speed(kbps):
+    # Pick the display unit via a lookup table instead of branching per tier
+    i = min(2, int(np.log2(max(kbps, 1.0)) // 10))
+    return f"{kbps / _SPEED_DIVS[i]:.2f} {_SPEED_UNITS[i]}"
 
-if sys.platform == 'win32':
-    import winreg
-    import ctypes
 
 class SmoothNetMonitor:
     def __init__(self):
@@ -32,6 +111,7 @@ class SmoothNetMonitor:
         self.setup_main_window()
 
         self.taskbar_mode = False
+        self._graph_hidden = False  # True while the graph is toggled off
         self.lock_movement = tk.BooleanVar(self.root, value=False)
         self.settings_window = None
         self.data_usage_window = None
@@ -41,7 +121,6 @@ class SmoothNetMonitor:
         self.create_widgets()
         self.setup_bindings()
         self.setup_tray_icon()
-        self.start_speed_thread()
         self.start_ui_update()
         self.root.mainloop()
 
@@ -77,9 +156,25 @@ class SmoothNetMonitor:
         # --- End of Positioning Code ---
 
     def setup_variables(self):
-        self.speed_queue = Queue()
-        self.download_data = deque(maxlen=50)
-        self.upload_data = deque(maxlen=50)
+        # Single-slot sampler->UI handoff: the UI only ever needs the newest
+        # sample, and a tuple assignment is atomic under the GIL, so no queue
+        # locking is needed. The sequence number tells the UI when it's fresh.
+        self._latest_sample = (0, 0.0, 0.0)  # (seq, down_kbps, up_kbps)
+        self._consumed_seq = 0
+        self._last_down_text = ""
+        self._last_up_text = ""
+        self._last_daily_down_text = ""
+        self._last_daily_up_text = ""
+        self._debounce_ids = {}
+        self._color_indicators = {}  # Filled in when the settings window is built
+        # Preallocated ring buffers: writes go to _buf_head, no per-sample
+        # allocation. float32 halves the footprint and is plenty for kB/s.
+        self.history_len = 300
+        self.download_data = np.zeros(self.history_len, dtype=np.float32)
+        self.upload_data = np.zeros(self.history_len, dtype=np.float32)
+        self._buf_head = 0
+        self._buf_filled = 0  # Samples written so far, capped at history_len
+        self._xaxis = np.arange(self.history_len)
         self.update_interval = 1000
         self.ui_refresh_rate = 500
         self.colors = {
@@ -90,19 +185,43 @@ class SmoothNetMonitor:
             'graph_bg': "#2a2a2a",
             'scale_color': "#ffffff"
         }
+        # Hot-path mirrors of the colors dict: attribute loads instead of dict
+        # lookups in the per-tick draw code. The dict stays the source of
+        # truth for the settings UI; _refresh_color_mirrors syncs these.
+        self._refresh_color_mirrors()
         self.graph_type = "Line"
         self.selected_adapter = "All"
-        self.running = True
+        self._read_stats = self._make_reader()
+        # Mirror the -alpha/-topmost window attributes set in setup_main_window
+        # so reading them back never needs a Tcl round trip
+        self._alpha = 0.9
+        self._topmost = True
+        self._old_stats = None  # Previous counter snapshot; primed on first sample
+        self._last_sample_ts = time.monotonic()
 
         self.graph_title = "Network Speed Graph"
         self.graph_title_font_size = 12
         self.graph_text_color = "#ffffff"
 
+        self._bg = None  # Cached blit background, rebuilt on style/limit changes
+        self._last_graph_draw = 0.0  # Graph redraws are capped at ~4 Hz
+        self._draw_pending = False  # True while a coalesced draw is queued
+        # Persistent Bar-mode rectangles; None forces a rebuild (color/type change)
+        self._bars_dl = None
+        self._bars_ul = None
+        self._graph_ymax = 1.0  # Decaying y-limit target for the line graph
+        self._graph_ylim = 1.0  # Limit actually applied to the axes
+        # Once the user customizes titles/scales we switch from the cheap Tk
+        # sparkline to the full matplotlib renderer, which supports them
+        self._graph_custom = False
+
         if sys.platform == 'win32':
             self.startup_var = tk.BooleanVar(value=True)
+            self._startup_state = self._query_startup()
             if self.startup_var.get():
                 self.set_startup(True)
 
+        self.tk_photo = None  # About-window photo, decoded lazily on first open
         self.minimal_width = 230
         self.minimal_height = 30
         self.minimal_font_size = 10
@@ -113,9 +232,63 @@ class SmoothNetMonitor:
         self.last_data_update_day = datetime.date.today()
         self.data_usage_file = "data_usage.csv"
 
-        self.hourly_data = defaultdict(lambda: {'download': 0, 'upload': 0})
+        # Keep one buffered append handle open instead of re-opening the CSV
+        # per save; rows are batched and flushed periodically. Because the
+        # file is append-only, the last row for a date is the current one.
+        write_header = not os.path.exists(self.data_usage_file) or os.path.getsize(self.data_usage_file) == 0
+        try:
+            self._csv_fh = open(self.data_usage_file, 'a', buffering=1 << 16, newline='')
+            self._csv_writer = csv.writer(self._csv_fh)
+            if write_header:
+                self._csv_writer.writerow(['Date', 'DownloadBytes', 'UploadBytes'])
+                self._csv_fh.flush()  # Keep ordering sane if io_uring takes over below
+        except Exception as e:
+            print(f"Error opening data usage file: {e}")
+            self._csv_fh = None
+            self._csv_writer = None
+        self._csv_buf = []
+        self._last_csv_flush = time.monotonic()
+        self._daily_table_cache = None  # Parsed CSV, keyed on (mtime, size)
+        self._daily_table_key = None
+        # Persistent usage-window bar artists, reused via set_height as long
+        # as the timeframe doesn't change
+        self._usage_artists = {'timeframe': None, 'dl': None, 'ul': None}
+
+        self._uring = None
+        if _HAS_LIBURING and self._csv_fh is not None:
+            try:
+                self._uring = _UringAppender(self.data_usage_file)
+            except Exception as e:
+                print(f"io_uring unavailable, using buffered writes: {e}")
+
+        # Dedicated writer thread: the Tk thread only enqueues (fn, args)
+        # jobs, so no disk write can ever stall the UI
+        self._io_queue = Queue()
+        threading.Thread(target=self._io_worker, daemon=True).start()
+
+        # Per-hour byte counters as two 24-slot arrays indexed by hour-of-day:
+        # constant-address stores, no dict hashing, and rollover is one fill(0)
+        self._hourly_dl = np.zeros(24, dtype=np.int64)
+        self._hourly_ul = np.zeros(24, dtype=np.int64)
+        self._current_hour = datetime.datetime.now().hour
+        # Rollovers track local wall-clock hours, so fold the UTC offset into
+        # the epoch (half-hour timezones shift mid-epoch otherwise); the
+        # offset is refreshed on each rollover to follow DST
+        self._utc_offset = datetime.datetime.now().astimezone().utcoffset().total_seconds()
+        self._last_hour_epoch = int((time.time() + self._utc_offset) // 3600)
+
+        # Shared per-NIC counter snapshot so the adapter list and the speed
+        # sampler don't each pay for a psutil.net_io_counters(pernic=True) call
+        self._net_snapshot = None
+        self._net_snapshot_ts = 0.0
+        self._adapter_list = ()
 
     def create_widgets(self):
+        import matplotlib
+        matplotlib.use('TkAgg')
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         self.top_bar = tk.Frame(self.root, bg=self.colors['background'])
         self.top_bar.pack(fill=tk.X)
 
@@ -146,13 +319,51 @@ class SmoothNetMonitor:
         self.normal_speed_font = self.down_label.cget("font")
         self.top_bar.grid_columnconfigure(1, weight=1)
 
+        # Every widget whose bg follows the 'background' color, so a color
+        # change is one loop instead of a hand-maintained list of .config calls
+        self._bg_widgets = [
+            self.top_bar, self.menu_button, self.title_label,
+            self.speed_frame, self.down_label, self.up_label
+        ]
+
         self.fig = plt.figure(figsize=(4, 3), facecolor=self.colors['graph_bg'])
         self.ax = self.fig.add_subplot(111, facecolor=self.colors['graph_bg'])
-        self.down_line, = self.ax.plot([], [], color=self.colors['download'], label="Download")
-        self.up_line, = self.ax.plot([], [], color=self.colors['upload'], label="Upload")
-        self.ax.legend(loc="upper left", fontsize=8)
+        self.down_line, = self.ax.plot([], [], color=self.colors['download'], label="Download", animated=True)
+        self.up_line, = self.ax.plot([], [], color=self.colors['upload'], label="Upload", animated=True)
+        self._legend = self.ax.legend(loc="upper left", fontsize=8)
         self.canvas = FigureCanvasTkAgg(self.fig, self.root)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._recapture_background()  # Initial draw + blit background capture
+        self.canvas.get_tk_widget().bind("<Configure>", self._on_canvas_resize)
+
+        # Lightweight Tk sparkline for Line mode: two persistent canvas line
+        # items updated in place, orders of magnitude cheaper than a
+        # matplotlib render for 50 points
+        self.spark = tk.Canvas(self.root, bg=self.colors['graph_bg'], highlightthickness=0)
+        self._spark_dl = self.spark.create_line(0, 0, 1, 1, fill=self.colors['download'], width=1)
+        self._spark_ul = self.spark.create_line(0, 0, 1, 1, fill=self.colors['upload'], width=1)
+        self._show_graph_widget()
+
+    def _on_canvas_resize(self, event=None):
+        self._bg = None  # Figure size changed; the cached background is invalid
+
+    def _use_spark(self):
+        # The sparkline covers the common case; matplotlib is only needed for
+        # Bar mode or when title/scale customization is in play
+        return self.graph_type == "Line" and not self._graph_custom
+
+    def _graph_widget(self):
+        return self.spark if self._use_spark() else self.canvas.get_tk_widget()
+
+    def _show_graph_widget(self):
+        self._tick_fn = self._build_tick_fn()  # Renderer choice feeds the specialized tick
+        if self.taskbar_mode or self._graph_hidden:
+            return  # Graph is hidden; don't force it back into the shrunken window
+        if self._use_spark():
+            self.canvas.get_tk_widget().pack_forget()
+            self.spark.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        else:
+            self.spark.pack_forget()
+            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
     def setup_bindings(self):
         self.title_label.bind("<ButtonPress-1>", self.start_drag)
@@ -194,6 +405,7 @@ class SmoothNetMonitor:
         # --- Notebook (Tabbed Interface) ---
         settings_notebook = ttk.Notebook(self.settings_window)
         settings_notebook.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        self._settings_notebook = settings_notebook  # Direct handle, no winfo_children() lookups
 
         # --- Window Appearance Tab ---
         appearance_tab = ttk.Frame(settings_notebook)
@@ -201,15 +413,15 @@ class SmoothNetMonitor:
 
         # Transparency Control
         ttk.Label(appearance_tab, text="Transparency:").grid(row=0, column=0, padx=settings_padx, pady=settings_pady, sticky=label_sticky)
-        self.transparency_var = tk.StringVar(value=str(self.root.attributes("-alpha")))
-        trans_scale = ttk.Scale(appearance_tab, from_=0.1, to=1.0, variable=tk.DoubleVar(value=self.root.attributes("-alpha")), command=self.update_transparency_value)
+        self.transparency_var = tk.StringVar(value=str(self._alpha))
+        trans_scale = ttk.Scale(appearance_tab, from_=0.1, to=1.0, variable=tk.DoubleVar(value=self._alpha), command=self.update_transparency_value)
         trans_scale.grid(row=0, column=1, padx=settings_padx, pady=settings_pady, sticky="ew")
         self.transparency_label = ttk.Label(appearance_tab, textvariable=self.transparency_var, width=4)
         self.transparency_label.grid(row=0, column=2, padx=settings_padx, pady=settings_pady, sticky=label_sticky)
 
         # Always On Top
         ttk.Label(appearance_tab, text="Always On Top:").grid(row=1, column=0, padx=settings_padx, pady=settings_pady, sticky=label_sticky)
-        always_on_top_var = tk.BooleanVar(value=self.root.attributes("-topmost"))
+        always_on_top_var = tk.BooleanVar(value=self._topmost)
         ttk.Checkbutton(appearance_tab, variable=always_on_top_var, command=lambda: self.set_always_on_top(always_on_top_var.get())).grid(row=1, column=1, padx=settings_padx, pady=settings_pady, sticky=label_sticky)
 
         # Lock Movement
@@ -239,6 +451,7 @@ class SmoothNetMonitor:
         self.interval_var = tk.StringVar(value=str(self.update_interval))
         interval_scale = ttk.Scale(graph_tab, from_=100, to=5000, variable=tk.DoubleVar(value=self.update_interval), command=self.update_interval_value)
         interval_scale.grid(row=0, column=1, padx=settings_padx, pady=settings_pady, sticky="ew")
+        self._interval_scale = interval_scale
         self.interval_entry = ttk.Entry(graph_tab, textvariable=self.interval_var, width=7)
         self.interval_entry.grid(row=0, column=2, padx=settings_padx, pady=settings_pady, sticky=label_sticky)
         self.interval_entry.bind("<FocusOut>", self.apply_interval_from_entry)
@@ -257,6 +470,7 @@ class SmoothNetMonitor:
         adapter_cb.set(self.selected_adapter)
         adapter_cb.grid(row=2, column=1, padx=settings_padx, pady=settings_pady, sticky="ew")
         adapter_cb.bind("<<ComboboxSelected>>", lambda event: self.set_adapter(adapter_cb.get()))
+        self._adapter_cb = adapter_cb
         self.update_adapter_list_in_settings(adapter_cb)
         graph_tab.columnconfigure(1, weight=1)
 
@@ -265,35 +479,22 @@ class SmoothNetMonitor:
         colors_tab = ttk.Frame(settings_notebook)
         settings_notebook.add(colors_tab, text="Colors")
 
-        # Background Color Button and Indicator
-        btn_bg = ttk.Button(colors_tab, text="Background", command=lambda: self.choose_color('background'))
-        btn_bg.grid(row=0, column=0, padx=settings_padx, pady=settings_pady, sticky="ew")
-        self.bg_color_indicator = tk.Frame(colors_tab, width=20, height=20, bg=self.colors['background'], relief=tk.SOLID, borderwidth=1) # Color indicator frame
-        self.bg_color_indicator.grid(row=0, column=1, padx=settings_padx, pady=settings_pady, sticky="w") # Placed to the right
-
-        # Download Line/Text Color Button and Indicator
-        btn_dl = ttk.Button(colors_tab, text="Download Line/Text", command=lambda: self.choose_color('download'))
-        btn_dl.grid(row=0, column=2, padx=settings_padx, pady=settings_pady, sticky="ew")
-        self.dl_color_indicator = tk.Frame(colors_tab, width=20, height=20, bg=self.colors['download'], relief=tk.SOLID, borderwidth=1) # Color indicator frame
-        self.dl_color_indicator.grid(row=0, column=3, padx=settings_padx, pady=settings_pady, sticky="w") # Placed to the right
-
-        # Upload Line/Text Color Button and Indicator
-        btn_ul = ttk.Button(colors_tab, text="Upload Line/Text", command=lambda: self.choose_color('upload'))
-        btn_ul.grid(row=1, column=0, padx=settings_padx, pady=settings_pady, sticky="ew")
-        self.ul_color_indicator = tk.Frame(colors_tab, width=20, height=20, bg=self.colors['upload'], relief=tk.SOLID, borderwidth=1) # Color indicator frame
-        self.ul_color_indicator.grid(row=1, column=1, padx=settings_padx, pady=settings_pady, sticky="w") # Placed to the right
-
-        # Graph Background Color Button and Indicator
-        btn_graph = ttk.Button(colors_tab, text="Graph Background", command=lambda: self.choose_color('graph_bg'))
-        btn_graph.grid(row=1, column=2, padx=settings_padx, pady=settings_pady, sticky="ew")
-        self.graph_bg_color_indicator = tk.Frame(colors_tab, width=20, height=20, bg=self.colors['graph_bg'], relief=tk.SOLID, borderwidth=1) # Color indicator frame
-        self.graph_bg_color_indicator.grid(row=1, column=3, padx=settings_padx, pady=settings_pady, sticky="w") # Placed to the right
-
-        # Scale Color Button and Indicator
-        btn_scale = ttk.Button(colors_tab, text="Scale Color", command=lambda: self.choose_color('scale_color'))
-        btn_scale.grid(row=2, column=0, columnspan=2, padx=settings_padx, pady=settings_pady, sticky="ew")
-        self.scale_color_indicator = tk.Frame(colors_tab, width=20, height=20, bg=self.colors['scale_color'], relief=tk.SOLID, borderwidth=1) # Color indicator frame
-        self.scale_color_indicator.grid(row=2, column=2, padx=settings_padx, pady=settings_pady, sticky="w") # Placed to the right
+        # Color buttons and indicators, built from one data-driven spec:
+        # (key, label, row, column, button columnspan)
+        color_specs = [
+            ('background', 'Background', 0, 0, 1),
+            ('download', 'Download Line/Text', 0, 2, 1),
+            ('upload', 'Upload Line/Text', 1, 0, 1),
+            ('graph_bg', 'Graph Background', 1, 2, 1),
+            ('scale_color', 'Scale Color', 2, 0, 2),
+        ]
+        self._color_indicators = {}
+        for key, label, row, col, span in color_specs:
+            btn = ttk.Button(colors_tab, text=label, command=lambda k=key: self.choose_color(k))
+            btn.grid(row=row, column=col, columnspan=span, padx=settings_padx, pady=settings_pady, sticky="ew")
+            indicator = tk.Frame(colors_tab, width=20, height=20, bg=self.colors[key], relief=tk.SOLID, borderwidth=1)
+            indicator.grid(row=row, column=col + span, padx=settings_padx, pady=settings_pady, sticky="w")
+            self._color_indicators[key] = indicator
         colors_tab.columnconfigure(0, weight=1)
         colors_tab.columnconfigure(2, weight=1) # Add weight to make buttons expand
 
@@ -350,13 +551,30 @@ class SmoothNetMonitor:
         print("Total show_settings execution time:", end_time - start_time)
 
 
+    def _debounce(self, token, ms, fn, *args):
+        # Coalesce rapid events (e.g. Scale drags): only the last call within
+        # the window actually fires, via root.after with cancellation
+        pending = self._debounce_ids.get(token)
+        if pending is not None:
+            self.root.after_cancel(pending)
+
+        def fire():
+            self._debounce_ids.pop(token, None)
+            fn(*args)
+
+        self._debounce_ids[token] = self.root.after(ms, fire)
+
     def update_transparency_value(self, value):
-        self.root.attributes("-alpha", float(value))
-        self.transparency_var.set(f"{float(value):.2f}") # Update label value
+        self._alpha = float(value)
+        self.transparency_var.set(f"{self._alpha:.2f}") # Update label value
+        self._debounce('alpha', 50, self.root.attributes, "-alpha", self._alpha)
 
     def update_interval_value(self, value):
-        self.update_interval = int(float(value))
-        self.interval_var.set(str(self.update_interval)) # Update entry value
+        self.interval_var.set(str(int(float(value)))) # Update entry value
+        self._debounce('interval', 100, self._commit_interval, int(float(value)))
+
+    def _commit_interval(self, value):
+        self.update_interval = value
 
     def apply_interval_from_entry(self, event=None): # Apply interval from Entry
         value_str = self.interval_var.get()
@@ -364,8 +582,7 @@ class SmoothNetMonitor:
             value = int(value_str)
             if 100 <= value <= 5000:
                 self.update_interval = value
-                interval_scale = self.settings_window.winfo_children()[2] # Get the scale - careful with index if structure changes
-                interval_scale.set(value) # Update the scale to match entry
+                self._interval_scale.set(value) # Update the scale to match entry
             else:
                 messagebox.showerror("Invalid Interval", "Interval must be between 100 and 5000 ms.")
                 self.interval_var.set(str(self.update_interval)) # Revert entry value
@@ -395,9 +612,35 @@ class SmoothNetMonitor:
     def update_adapter_list_in_settings(self, adapter_combobox):
         threading.Thread(target=self._get_adapters_threaded, args=(adapter_combobox,), daemon=True).start()
 
+    def _read_proc_net_dev(self):
+        # Direct /proc/net/dev parse on Linux: much cheaper than psutil's
+        # pernic path, which allocates a full 8-field namedtuple per adapter
+        with open('/proc/net/dev', 'rb') as f:
+            data = f.read()
+        out = {}
+        for line in data.split(b'\n')[2:]:
+            if not line:
+                continue
+            name, rest = line.split(b':', 1)
+            fields = rest.split()
+            out[name.strip().decode()] = _NicCounters(int(fields[0]), int(fields[8]))
+        return out
+
+    def _sample_net(self, max_age=0.0):
+        # Take (or reuse) one pernic counter snapshot; max_age > 0 allows a
+        # recent snapshot to be reused instead of re-reading all adapters
+        now = time.monotonic()
+        if self._net_snapshot is None or now - self._net_snapshot_ts > max_age:
+            if sys.platform.startswith('linux'):
+                self._net_snapshot = self._read_proc_net_dev()
+            else:
+                self._net_snapshot = psutil.net_io_counters(pernic=True)
+            self._net_snapshot_ts = now
+        return self._net_snapshot
+
     def _get_adapters_threaded(self, adapter_combobox):
         try:
-            adapters = list(psutil.net_io_counters(pernic=True).keys())
+            adapters = list(self._sample_net(max_age=2.0).keys())
             adapters.sort()
             adapters.insert(0, "All")
         except Exception:
@@ -406,7 +649,9 @@ class SmoothNetMonitor:
         self.root.after(0, lambda: self._update_adapter_combobox_callback(adapter_combobox, adapters))
 
     def _update_adapter_combobox_callback(self, adapter_combobox, adapters):
-        adapter_combobox['values'] = adapters
+        if tuple(adapters) != self._adapter_list:  # Skip the Tk round trip if unchanged
+            self._adapter_list = tuple(adapters)
+            adapter_combobox['values'] = adapters
         if self.selected_adapter in adapters:
             adapter_combobox.set(self.selected_adapter)
         else:
@@ -452,59 +697,6 @@ class SmoothNetMonitor:
             self.root.geometry(f"{w}x{h}")
         except ValueError:
             messagebox.showerror("Invalid Size", "Width and Height must be integers.")
-    def set_always_on_top(self, always_top):
-        self.root.attributes("-topmost", always_top)
-
-    def set_graph_type(self, graph_type):
-        self.graph_type = graph_type
-        self.update_graph() # Update graph to reflect type change
-
-    def set_adapter(self, adapter_name):
-        self.selected_adapter = adapter_name
-
-    def choose_color(self, setting_name):
-        initial_color = self.colors.get(setting_name, "#ffffff") # Default white if not found
-        color_code = colorchooser.askcolor(initialcolor=initial_color)
-        if color_code and color_code[1]:
-            color_hex = color_code[1]
-            self.colors[setting_name] = color_hex
-            if setting_name == 'background':
-                self.root.config(bg=color_hex)
-                self.top_bar.config(bg=color_hex)
-                self.menu_button.config(bg=color_hex)
-                self.title_label.config(bg=color_hex)
-                self.speed_frame.config(bg=color_hex)
-                self.bg_color_indicator.config(bg=color_hex) # Update indicator color
-                if self.settings_window: # Check if settings window exists to avoid errors
-                    settings_bg = self.settings_window.winfo_children()[0] # Notebook is the first child
-                    if settings_bg:
-                        settings_bg.config(bg=color_hex) # Apply to notebook
-            elif setting_name == 'download':
-                self.down_label.config(fg=color_hex)
-                self.down_line.set_color(color_hex) # Update graph line color
-                self.dl_color_indicator.config(bg=color_hex) # Update indicator color
-                self.update_graph() # Redraw graph to apply color change
-            elif setting_name == 'upload':
-                self.up_label.config(fg=color_hex)
-                self.up_line.set_color(color_hex) # Update graph line color
-                self.ul_color_indicator.config(bg=color_hex) # Update indicator color
-                self.update_graph() # Redraw graph to apply color change
-            elif setting_name == 'graph_bg':
-                self.ax.set_facecolor(color_hex)
-                self.fig.patch.set_facecolor(color_hex)
-                self.canvas.draw() # Redraw the canvas to update background color
-                self.graph_bg_color_indicator.config(bg=color_hex) # Update indicator color
-            elif setting_name == 'scale_color':
-                self.set_scale_color(color_hex)
-                self.scale_color_indicator.config(bg=color_hex) # Update indicator color
-        self.save_settings() # Save settings after color change
-
-    def set_scale_color(self, color_hex):
-        self.colors['scale_color'] = color_hex
-        self.ax.tick_params(axis='x', colors=color_hex)
-        self.ax.tick_params(axis='y', colors=color_hex)
-        self.update_data_usage_graph() # Update graph to apply scale color change
-
 
     def show_graph_text_settings(self):
         if hasattr(self, 'graph_text_window') and self.graph_text_window and tk.Toplevel.winfo_exists(self.graph_text_window):
@@ -545,7 +737,7 @@ class SmoothNetMonitor:
     def update_graph_font_size_value(self, value):
         self.graph_title_font_size = int(value)
         self.font_size_label.config(text=str(self.graph_title_font_size)) # Update font size label
-        self.update_graph_text_options() # Apply changes to graph
+        self._debounce('font_size', 100, self.update_graph_text_options) # Redraw once per drag
 
     def apply_graph_title(self, event=None):
         self.graph_title = self.graph_title_var.get()
@@ -560,58 +752,87 @@ class SmoothNetMonitor:
 
     def update_graph_text_options(self):
         self.ax.set_title(self.graph_title, fontsize=self.graph_title_font_size, color=self.graph_text_color)
-        self.canvas.draw_idle() # Update graph title and redraw
+        self._graph_custom = True
+        self._bg = None  # Title is part of the cached background
+        self._show_graph_widget()
+        self.update_graph()
 
     def close_graph_text_settings(self):
         if self.graph_text_window:
             self.graph_text_window.destroy()
             self.graph_text_window = None
     def set_always_on_top(self, value):
+        self._topmost = value
         self.root.attributes("-topmost", value)
 
+    def _refresh_color_mirrors(self):
+        colors = self.colors
+        self._c_download = colors['download']
+        self._c_upload = colors['upload']
+        self._c_graph_bg = colors['graph_bg']
+        self._c_scale = colors['scale_color']
+        self._c_text = colors['text']
+
     def choose_color(self, element):
         color = colorchooser.askcolor(title=f"Choose {element} color")
         if color[1]:
             self.colors[element] = color[1]
+            self._refresh_color_mirrors()
             if element == 'background':
                 self.root.config(bg=color[1])
-                self.top_bar.config(bg=color[1])
-                self.menu_button.config(bg=color[1])
-                self.title_label.config(bg=color[1])
-                self.speed_frame.config(bg=color[1])
-                self.down_label.config(bg=color[1])
-                self.up_label.config(bg=color[1])
-                self.bg_color_indicator.config(bg=color[1]) # Update indicator color
+                for widget in self._bg_widgets:
+                    widget.config(bg=color[1])
             elif element == 'download':
                 self.down_label.config(fg=color[1])
                 self.down_line.set_color(color[1])
-                self.dl_color_indicator.config(bg=color[1]) # Update indicator color
+                self.spark.itemconfig(self._spark_dl, fill=color[1])
+                self._update_legend_colors()
+                self._usage_artists['timeframe'] = None  # Usage bars carry this color
+                self.update_data_usage_graph()
             elif element == 'upload':
                 self.up_label.config(fg=color[1])
                 self.up_line.set_color(color[1])
-                self.ul_color_indicator.config(bg=color[1]) # Update indicator color
+                self.spark.itemconfig(self._spark_ul, fill=color[1])
+                self._update_legend_colors()
+                self._usage_artists['timeframe'] = None  # Usage bars carry this color
+                self.update_data_usage_graph()
             elif element == 'graph_bg':
                 self.ax.set_facecolor(color[1])
                 self.fig.patch.set_facecolor(color[1])
-                self.graph_bg_color_indicator.config(bg=color[1]) # Update indicator color
+                self.spark.config(bg=color[1])
             elif element == 'scale_color':
                 self.set_scale_color(color[1])
-                self.scale_color_indicator.config(bg=color[1]) # Update indicator color
-            self.canvas.draw_idle()
+            if element in self._color_indicators:
+                self._color_indicators[element].config(bg=color[1]) # Update indicator color
+            self._bg = None  # Style changed; rebuild the cached blit background
+            self._bars_dl = None  # Bar rectangles carry the old colors
+            self.update_graph()
 
     def set_scale_color(self, color_value):
         self.colors['scale_color'] = color_value
+        self._refresh_color_mirrors()
+        self._graph_custom = True  # Scales only exist on the matplotlib renderer
+        self._bg = None
+        self._show_graph_widget()
         self.update_graph()
+        self._usage_artists['timeframe'] = None  # Tick colors are rebuild-only styling
         self.update_data_usage_graph()
 
     def set_graph_type(self, value):
         self.graph_type = value
+        self._bg = None
+        self._bars_dl = None  # Bars must be rebuilt for the new mode
+        self._show_graph_widget()
         self.update_graph()
 
     def set_adapter(self, value):
         self.selected_adapter = value
-        self.download_data.clear()
-        self.upload_data.clear()
+        self._read_stats = self._make_reader()
+        self._old_stats = None  # Don't compute a delta across different adapters
+        self.download_data.fill(0)
+        self.upload_data.fill(0)
+        self._buf_head = 0
+        self._buf_filled = 0
 
     def update_startup(self):
         if self.startup_var.get():
@@ -619,12 +840,28 @@ class SmoothNetMonitor:
         else:
             self.set_startup(False)
 
+    def _query_startup(self):
+        # One registry read at startup so set_startup can skip no-op writes
+        import winreg
+        try:
+            reg_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, reg_path) as key:
+                winreg.QueryValueEx(key, "NetSpeedPro")
+            return True
+        except OSError:
+            return False
+
     def set_startup(self, enable):
         if sys.platform != 'win32':
             return
+        if enable == self._startup_state:
+            return  # Registry already matches; don't touch it
+        import winreg
         try:
             reg_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, reg_path, 0, winreg.KEY_ALL_ACCESS)
+            # KEY_SET_VALUE is all we need; KEY_ALL_ACCESS can fail under
+            # restricted accounts even though writing the value would succeed
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, reg_path, 0, winreg.KEY_SET_VALUE)
             if enable:
                 winreg.SetValueEx(key, "NetSpeedPro", 0, winreg.REG_SZ, os.path.abspath(sys.argv[0]))
             else:
@@ -633,10 +870,13 @@ class SmoothNetMonitor:
                 except FileNotFoundError:
                     pass
             winreg.CloseKey(key)
+            self._startup_state = enable
         except Exception as e:
             print("Error updating startup setting:", e)
 
     def show_about(self):
+        from PIL import Image, ImageTk
+
         about = tk.Toplevel(self.root)
         about.title("About")
         about.attributes("-topmost", True)
@@ -644,9 +884,12 @@ class SmoothNetMonitor:
         about.resizable(False, False)
 
         try:
-            photo_image = Image.open("my_photo.png")
-            photo_image = photo_image.resize((100, 100), Image.Resampling.LANCZOS)
-            self.tk_photo = ImageTk.PhotoImage(photo_image)
+            # Decode and resize once; reopening the About window reuses the
+            # cached PhotoImage (LANCZOS resampling is the slow part)
+            if self.tk_photo is None:
+                photo_image = Image.open("my_photo.png")
+                photo_image = photo_image.resize((100, 100), Image.Resampling.LANCZOS)
+                self.tk_photo = ImageTk.PhotoImage(photo_image)
             photo_label = ttk.Label(about, image=self.tk_photo)
             photo_label.pack(pady=10)
         except FileNotFoundError:
@@ -697,45 +940,197 @@ class SmoothNetMonitor:
         color = colorchooser.askcolor(title="Choose Graph Text Color")
         if color[1]:
             self.graph_text_color = color[1]
-            self.update_graph()
+            self._graph_custom = True
+            # Restyle the existing title in place; no need for a full
+            # clear-and-rebuild of the axes
+            self.ax.title.set_color(color[1])
+            self._bg = None
+            self._show_graph_widget()
+            self._request_draw()
 
     def set_graph_text(self, title, font_size):
         try:
             self.graph_title_font_size = int(font_size)
         except ValueError:
             messagebox.showerror("Invalid Font Size", "Font size must be an integer.")
+        self._graph_custom = True
+        self._bg = None
+        self._bars_dl = None  # Title styling is applied on the bar rebuild path
+        self._show_graph_widget()
         self.update_graph()
 
-    def update_graph(self):
+    def _ensure_legend(self):
+        # The legend survives between draws; only rebuild it after an
+        # ax.clear() has thrown it away
+        if self.ax.get_legend() is None:
+            self._legend = self.ax.legend(loc="upper left", fontsize=8)
+
+    def _update_legend_colors(self):
+        # Legend entries hold their own proxy handles, so a line color change
+        # has to be mirrored into them explicitly
+        pair = (self._c_download, self._c_upload)
+        for handle, c in zip(self._legend.get_lines(), pair):
+            handle.set_color(c)
+        for patch, c in zip(self._legend.get_patches(), pair):
+            patch.set_facecolor(c)
+
+    def _recapture_background(self):
+        # Render the static parts of the figure (title, ticks, legend, background)
+        # once and cache the result, so update_graph only has to blit the two lines.
+        if self.ax.patches:
+            # Leaving Bar mode: drop any leftover rectangles before the static
+            # render, or they would burn into the blit background. Keyed on the
+            # axes' actual contents — the _bars_dl sentinel may already be
+            # nulled by the settings change that got us here.
+            self.ax.clear()
+            self._bars_dl = None
+            self._bars_ul = None
+        if self.down_line not in self.ax.lines:
+            # Lines were removed by a Bar-mode ax.clear(); recreate them
+            self.down_line, = self.ax.plot([], [], color=self._c_download, label="Download", animated=True)
+            self.up_line, = self.ax.plot([], [], color=self._c_upload, label="Upload", animated=True)
+        self.ax.set_xlim(0, self.history_len - 1)
+        self.ax.set_ylim(0, self._graph_ymax)
+        self._graph_ylim = self._graph_ymax
+        self._ensure_legend()
+        self.ax.set_facecolor(self._c_graph_bg)
+        self.fig.patch.set_facecolor(self._c_graph_bg)
+        self.ax.set_title(self.graph_title, fontsize=self.graph_title_font_size, color=self.graph_text_color)
+        self.ax.tick_params(axis='x', colors=self._c_scale)
+        self.ax.tick_params(axis='y', colors=self._c_scale)
+        self.canvas.draw()
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def _graph_history(self):
+        # Unroll the ring buffers into chronological order (one vectorized copy
+        # each). Until the buffers wrap only the filled prefix is returned, so
+        # the graph shows real samples instead of a wall of leading zeros.
+        if self._buf_filled < self.history_len:
+            n = self._buf_filled
+            return self.download_data[:n], self.upload_data[:n]
+        h = self._buf_head
+        dl = np.concatenate((self.download_data[h:], self.download_data[:h]))
+        ul = np.concatenate((self.upload_data[h:], self.upload_data[:h]))
+        return dl, ul
+
+    def _update_sparkline(self, dl, ul):
+        n = dl.size
+        w = self.spark.winfo_width()
+        h = self.spark.winfo_height()
+        if w <= 1 or h <= 1 or n < 2:
+            return  # Not laid out yet, or too few samples for a line
+        pad = 2
+        ymax = max(dl.max(), ul.max(), 1.0)
+        xs = self._xaxis[:n] * (w / (n - 1))
+        scale = (h - 2 * pad) / ymax
+        # Flat [x0, y0, x1, y1, ...] coordinate lists in one vectorized pass
+        coords = np.empty(2 * n)
+        coords[0::2] = xs
+        coords[1::2] = (h - pad) - dl * scale
+        self.spark.coords(self._spark_dl, *coords.tolist())
+        coords[1::2] = (h - pad) - ul * scale
+        self.spark.coords(self._spark_ul, *coords.tolist())
+
+    def _blit_lines(self, dl, ul):
+        if self._bg is None:
+            self._recapture_background()
+        if dl.size == 0:
+            return
+        target = max(dl.max(), ul.max(), 1.0) * 1.25
+        if target > self._graph_ymax:
+            self._graph_ymax = target
+        else:
+            # Decay toward the current peak so one burst doesn't pin the
+            # scale and flatten everything that follows
+            self._graph_ymax = max(self._graph_ymax * 0.995, target)
+        # Re-rendering the background is the expensive part; only do it when
+        # the limit has drifted more than ~10% from what is on screen
+        if self._graph_ymax > self._graph_ylim or self._graph_ymax < self._graph_ylim * 0.9:
+            self._recapture_background()
+        self.canvas.restore_region(self._bg)
+        self.down_line.set_data(self._xaxis[:dl.size], dl)
+        self.up_line.set_data(self._xaxis[:ul.size], ul)
+        self.ax.draw_artist(self.down_line)
+        self.ax.draw_artist(self.up_line)
+        self.canvas.blit(self.ax.bbox)
+
+    def _draw_bars(self, dl, ul):
+        bars = self._bars_dl
+        if bars is not None and len(bars) == dl.size:
+            # Same rectangles, new heights; no artist churn (the usage window
+            # reuses its bars the same way)
+            for rect, value in zip(bars, dl):
+                rect.set_height(value)
+            for rect, value in zip(self._bars_ul, ul):
+                rect.set_height(value)
+            self.ax.relim()
+            self.ax.autoscale_view()
+            self._request_draw()
+            return
         self.ax.clear()
-        if self.graph_type == "Line":
-            self.ax.plot(range(len(self.download_data)), list(self.download_data), color=self.colors['download'], label="Download")
-            self.ax.plot(range(len(self.upload_data)), list(self.upload_data), color=self.colors['upload'], label="Upload")
-        elif self.graph_type == "Bar":
-            indices = list(range(len(self.download_data)))
-            width = 0.4
-            self.ax.bar([i - width/2 for i in indices], list(self.download_data), width=width, color=self.colors['download'], label="Download")
-            self.ax.bar([i + width/2 for i in indices], list(self.upload_data), width=width, color=self.colors['upload'], label="Upload")
-        self.ax.legend(loc="upper left", fontsize=8)
-        self.ax.set_facecolor(self.colors['graph_bg'])
-        self.fig.patch.set_facecolor(self.colors['graph_bg'])
+        width = 0.4
+        x = self._xaxis[:dl.size]
+        self._bars_dl = self.ax.bar(x - width/2, dl, width=width, color=self._c_download, label="Download")
+        self._bars_ul = self.ax.bar(x + width/2, ul, width=width, color=self._c_upload, label="Upload")
+        self._ensure_legend()
+        self.ax.set_facecolor(self._c_graph_bg)
+        self.fig.patch.set_facecolor(self._c_graph_bg)
         self.ax.relim()
         self.ax.autoscale_view()
         self.ax.set_title(self.graph_title, fontsize=self.graph_title_font_size, color=self.graph_text_color)
-        self.ax.tick_params(axis='x', colors=self.colors['scale_color'])
-        self.ax.tick_params(axis='y', colors=self.colors['scale_color'])
+        self.ax.tick_params(axis='x', colors=self._c_scale)
+        self.ax.tick_params(axis='y', colors=self._c_scale)
+        self._request_draw()
+
+    def _request_draw(self):
+        # Coalesce draw requests: several calls in one event-loop pass (e.g. a
+        # tick landing on top of a settings change) become a single draw
+        if self._draw_pending:
+            return
+        self._draw_pending = True
+        self.root.after_idle(self._do_draw)
+
+    def _do_draw(self):
+        self._draw_pending = False
+        self.canvas.draw()
+
+    def _build_tick_fn(self):
+        # Specialize the per-tick redraw on the current renderer and graph
+        # type: the branch is decided here, once per settings change, instead
+        # of on every tick (closures rather than exec-based codegen)
+        history = self._graph_history
+        if self._use_spark():
+            update = self._update_sparkline
+        elif self.graph_type == "Line":
+            update = self._blit_lines
+        else:
+            update = self._draw_bars
+
+        def tick():
+            dl, ul = history()
+            update(dl, ul)
+
+        return tick
+
+    def update_graph(self):
+        self._tick_fn()
 
     def toggle_graph(self):
-        if self.canvas.get_tk_widget().winfo_ismapped():
+        if self._graph_widget().winfo_ismapped():
+            self._graph_hidden = True
             self.root.geometry("300x30")
+            self.spark.pack_forget()
             self.canvas.get_tk_widget().pack_forget()
         else:
+            self._graph_hidden = False
             self.root.geometry("300x250")
-            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            self._show_graph_widget()
+            self._request_draw()  # Repaint straight away, not on the next tick
 
     def toggle_taskbar_display(self):
         if not self.taskbar_mode:
             self.taskbar_mode = True
+            self.spark.pack_forget()
             self.canvas.get_tk_widget().pack_forget()
             self.root.geometry(f"{self.minimal_width}x{self.minimal_height}")
             self.root.overrideredirect(True)
@@ -757,7 +1152,8 @@ class SmoothNetMonitor:
             self.title_label.grid(row=0, column=1, padx=5, sticky="w")
             self.root.unbind("<ButtonPress-1>")
             self.root.unbind("<B1-Motion>")
-            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            self._show_graph_widget()
+            self._request_draw()  # Repaint straight away, not on the next tick
 
     def minimal_start_drag(self, event):
         if self.lock_movement.get():
@@ -773,6 +1169,7 @@ class SmoothNetMonitor:
         self.root.geometry(f"+{new_x}+{new_y}")
 
     def force_show_in_taskbar(self):
+        import ctypes
         hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
         GWL_EXSTYLE = -20
         WS_EX_APPWINDOW = 0x00040000
@@ -781,6 +1178,8 @@ class SmoothNetMonitor:
         ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style)
 
     def setup_tray_icon(self):
+        from pystray import MenuItem as item, Icon
+
         menu = (
             item('Show/Hide Graph', self.toggle_graph),
             item('Data Used', self.show_data_usage_window),
@@ -788,155 +1187,219 @@ class SmoothNetMonitor:
             item('About', self.show_about),
             item('Exit', self.clean_exit)
         )
-        try:
-            tray_image = Image.open("icon.png").convert("RGBA")
-        except:
-            tray_image = Image.new('RGB', (64, 64), (42, 42, 42))
-            draw = ImageDraw.Draw(tray_image)
-            draw.ellipse((16, 16, 48, 48), fill=self.colors['download'])
-
+        tray_image = _load_tray_image(self.colors['download'])
         self.tray_icon = Icon("netspeed", tray_image, menu=menu)
         threading.Thread(target=self.tray_icon.run, daemon=True).start()
 
-    def start_speed_thread(self):
-        self.speed_thread = threading.Thread(target=self.measure_speeds, daemon=True)
-        self.speed_thread.start()
-
-    def measure_speeds(self):
+    def _make_reader(self):
+        # Specialize the counter read on the selected adapter once, instead of
+        # re-testing the selection string on every sample (same pattern as
+        # _build_tick_fn for the graph)
         if self.selected_adapter == "All":
-            old_stats = psutil.net_io_counters()
-        else:
+            return psutil.net_io_counters
+        adapter = self.selected_adapter
+        sample_net = self._sample_net
+
+        def read():
             try:
-                old_stats = psutil.net_io_counters(pernic=True)[self.selected_adapter]
+                return sample_net()[adapter]
             except KeyError:
-                old_stats = psutil.net_io_counters()
-        while self.running:
-            time.sleep(self.update_interval / 1000)
-            if self.selected_adapter == "All":
-                new_stats = psutil.net_io_counters()
-            else:
-                try:
-                    new_stats = psutil.net_io_counters(pernic=True)[self.selected_adapter]
-                except KeyError:
-                    new_stats = psutil.net_io_counters()
-            down_kbps = (new_stats.bytes_recv - old_stats.bytes_recv) / 1024
-            up_kbps = (new_stats.bytes_sent - old_stats.bytes_sent) / 1024
-            old_stats = new_stats
-
-            current_datetime = datetime.datetime.now()
+                return psutil.net_io_counters()
+        return read
+
+    def _sample_speeds(self, now):
+        new_stats = self._read_stats()
+
+        elapsed = now - self._last_sample_ts
+        self._last_sample_ts = now
+        old_stats = self._old_stats
+        self._old_stats = new_stats
+        if old_stats is None or elapsed <= 0:
+            return  # First sample just primes the counters
+
+        download_bytes_interval = new_stats.bytes_recv - old_stats.bytes_recv
+        upload_bytes_interval = new_stats.bytes_sent - old_stats.bytes_sent
+        down_kbps = download_bytes_interval / 1024 / elapsed
+        up_kbps = upload_bytes_interval / 1024 / elapsed
+
+        # Rollovers can only happen when the wall-clock hour changes, so a
+        # cheap integer comparison replaces a datetime.now() per sample
+        wall = time.time()
+        hour_epoch = int((wall + self._utc_offset) // 3600)
+        if hour_epoch != self._last_hour_epoch:
+            self._last_hour_epoch = hour_epoch
+            current_datetime = datetime.datetime.fromtimestamp(wall)
+            self._utc_offset = current_datetime.astimezone().utcoffset().total_seconds()
             current_day = current_datetime.date()
             current_hour = current_datetime.hour
 
             if current_day != self.last_data_update_day:
                 self.save_daily_data()
+                self._flush_csv(sync=True)  # Day rollover is the one place worth an fsync
                 self.daily_download_bytes = 0
                 self.daily_upload_bytes = 0
                 self.last_data_update_day = current_day
-                self.hourly_data.clear()
-
-            interval_seconds = self.update_interval / 1000.0
-            download_bytes_interval = int(down_kbps * 1024 * interval_seconds)
-            upload_bytes_interval = int(up_kbps * 1024 * interval_seconds)
+                self._hourly_dl.fill(0)
+                self._hourly_ul.fill(0)
 
-            self.daily_download_bytes += download_bytes_interval
-            self.daily_upload_bytes += upload_bytes_interval
+            if current_hour != self._current_hour:
+                # Persist once per hour so a crash loses at most an hour
+                self.save_hourly_data()
+                self._current_hour = current_hour
 
-            self.hourly_data[current_hour]['download'] += download_bytes_interval
-            self.hourly_data[current_hour]['upload'] += upload_bytes_interval
+        self.daily_download_bytes += download_bytes_interval
+        self.daily_upload_bytes += upload_bytes_interval
 
+        self._hourly_dl[self._current_hour] += download_bytes_interval
+        self._hourly_ul[self._current_hour] += upload_bytes_interval
 
-            self.speed_queue.put((down_kbps, up_kbps))
+        seq = self._latest_sample[0] + 1
+        self._latest_sample = (seq, down_kbps, up_kbps)
 
     def start_ui_update(self):
+        # Single heartbeat on the Tk thread: net_io_counters is microseconds,
+        # so sampling inline avoids a sampler thread, a cross-thread handoff
+        # and a second timer's worth of wakeups
+        now = time.monotonic()
+        if now - self._last_sample_ts >= self.update_interval / 1000.0:
+            self._sample_speeds(now)
         self.update_labels()
-        self.root.after(self.ui_refresh_rate, self.start_ui_update)
+        # Tick at the faster of the two rates so sub-500ms sampling intervals
+        # are honored; re-read each tick so interval changes take effect
+        self.root.after(min(self.ui_refresh_rate, self.update_interval), self.start_ui_update)
 
     def update_labels(self):
-        try:
-            while True:
-                down, up = self.speed_queue.get_nowait()
-                if down >= 1024:
-                    down_disp = down / 1024
-                    down_unit = "MB/s"
-                else:
-                    down_disp = down
-                    down_unit = "KB/s"
-                if up >= 1024:
-                    up_disp = up / 1024
-                    up_unit = "MB/s"
-                else:
-                    up_disp = up
-                    up_unit = "KB/s"
-                self.down_label.config(text=f"▼ {down_disp:.2f} {down_unit}")
-                self.up_label.config(text=f"▲ {up_disp:.2f} {up_unit}")
-                self.download_data.append(down)
-                self.upload_data.append(up)
-        except:
-            pass
-        self.update_graph()
-        self.canvas.draw_idle()
+        seq, down, up = self._latest_sample
+        if seq != self._consumed_seq:
+            self._consumed_seq = seq
+            down_text = f"▼ {_fmt_speed(down)}"
+            up_text = f"▲ {_fmt_speed(up)}"
+            # Skip the Tk round trip when the displayed text hasn't changed
+            if down_text != self._last_down_text:
+                self._last_down_text = down_text
+                self.down_label.config(text=down_text)
+            if up_text != self._last_up_text:
+                self._last_up_text = up_text
+                self.up_label.config(text=up_text)
+            self.download_data[self._buf_head] = down
+            self.upload_data[self._buf_head] = up
+            self._buf_head = (self._buf_head + 1) % self.history_len
+            if self._buf_filled < self.history_len:
+                self._buf_filled += 1
+        now = time.monotonic()
+        if self.taskbar_mode or self.root.state() == 'withdrawn' or not self._graph_widget().winfo_ismapped():
+            # Nobody can see the graph: keep the accounting above but skip all
+            # draw work. Drop the blit background too — it will be stale by
+            # the time the window comes back.
+            self._bg = None
+        elif now - self._last_graph_draw >= 0.25:
+            # Labels update every tick (they're cheap); the graph redraw rate
+            # is capped independently of the UI refresh rate
+            self._last_graph_draw = now
+            self.update_graph()
         self.update_daily_usage_display()
 
     def minimize_to_tray(self):
         self.root.withdraw()
 
     def clean_exit(self):
-        self.running = False
         self.tray_icon.stop()
         self.save_daily_data()
         self.save_hourly_data()
+        self._flush_csv()
+        self._io_queue.join()  # Let the writer thread drain before closing handles
+        if self._uring is not None:
+            self._uring.close()
+        if self._csv_fh is not None:
+            self._csv_fh.close()
         self.root.destroy()
         os._exit(0)
 
-    def format_bytes(self, bytes_val):
-        units = ['Bytes', 'KB', 'MB', 'GB', 'TB']
-        unit_index = 0
-        while bytes_val >= 1024 and unit_index < len(units) - 1:
-            bytes_val /= 1024
-            unit_index += 1
-        return f"{bytes_val:.2f} {units[unit_index]}"
-
     def update_daily_usage_display(self):
         if self.data_usage_window and tk.Toplevel.winfo_exists(self.data_usage_window): # Check if window and labels exist
             if hasattr(self, 'daily_down_usage_label') and hasattr(self, 'daily_up_usage_label'): # Double check labels exist
-                self.daily_down_usage_label.config(text=f"Download: {self.format_bytes(self.daily_download_bytes)}")
-                self.daily_up_usage_label.config(text=f"Upload: {self.format_bytes(self.daily_upload_bytes)}")
+                down_text = f"Download: {format_bytes(self.daily_download_bytes)}"
+                up_text = f"Upload: {format_bytes(self.daily_upload_bytes)}"
+                # Skip the Label.config round trip when nothing visible changed
+                if down_text != self._last_daily_down_text:
+                    self._last_daily_down_text = down_text
+                    self.daily_down_usage_label.config(text=down_text)
+                if up_text != self._last_daily_up_text:
+                    self._last_daily_up_text = up_text
+                    self.daily_up_usage_label.config(text=up_text)
 
     def load_daily_data(self):
         if os.path.exists(self.data_usage_file):
             try:
+                found_today = False
                 with open(self.data_usage_file, 'r', newline='') as csvfile:
                     reader = csv.DictReader(csvfile)
                     for row in reader:
                         file_date = datetime.datetime.strptime(row['Date'], '%Y-%m-%d').date()
                         if file_date == datetime.date.today():
+                            # Append-only file: the last row for a date wins
                             self.daily_download_bytes = int(row['DownloadBytes'])
                             self.daily_upload_bytes = int(row['UploadBytes'])
                             self.last_data_update_day = file_date
-                            return
+                            found_today = True
+                if found_today:
+                    return
             except Exception as e:
                 print(f"Error loading daily data: {e}")
 
         self.daily_download_bytes = 0
         self.daily_upload_bytes = 0
         self.last_data_update_day = datetime.date.today()
-        self.hourly_data.clear()
+        self._hourly_dl.fill(0)
+        self._hourly_ul.fill(0)
         self.load_hourly_data()
 
 
     def save_daily_data(self):
-        try:
-            with open(self.data_usage_file, 'w', newline='') as csvfile:
-                fieldnames = ['Date', 'DownloadBytes', 'UploadBytes']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerow({
-                    'Date': self.last_data_update_day.strftime('%Y-%m-%d'),
-                    'DownloadBytes': str(self.daily_download_bytes),
-                    'UploadBytes': str(self.daily_upload_bytes)
-                })
-        except Exception as e:
-            print(f"Error saving daily data: {e}")
+        self._csv_buf.append((
+            self.last_data_update_day.strftime('%Y-%m-%d'),
+            self.daily_download_bytes,
+            self.daily_upload_bytes
+        ))
+        if len(self._csv_buf) >= 64 or time.monotonic() - self._last_csv_flush >= 60:
+            self._flush_csv()
+
+    def _io_worker(self):
+        while True:
+            fn, args = self._io_queue.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"Background I/O error: {e}")
+            finally:
+                self._io_queue.task_done()
+
+    def _flush_csv(self, sync=False):
+        if self._csv_buf:
+            rows = self._csv_buf[:]
+            self._csv_buf.clear()
+            self._io_queue.put((self._write_daily_rows, (rows, sync)))
+        self._last_csv_flush = time.monotonic()
+
+    def _write_daily_rows(self, rows, sync=False):
+        # Runs on the writer thread
+        if self._uring is not None:
+            try:
+                data = ''.join('%s,%d,%d\r\n' % row for row in rows).encode()
+                self._uring.write(data)
+                return
+            except Exception as e:
+                print(f"io_uring write failed, falling back to buffered writes: {e}")
+                self._uring = None
+        # One writerows + flush per batch instead of an open/write/close per row
+        if self._csv_writer is not None:
+            try:
+                self._csv_writer.writerows(rows)
+                self._csv_fh.flush()
+                if sync:
+                    os.fsync(self._csv_fh.fileno())
+            except Exception as e:
+                print(f"Error saving daily data: {e}")
 
     def show_data_usage_window(self):
         if self.data_usage_window is not None and tk.Toplevel.winfo_exists(self.data_usage_window):
@@ -963,12 +1426,15 @@ class SmoothNetMonitor:
         self.daily_up_usage_label.pack()
 
         # Graph Area
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         self.usage_fig = plt.Figure(figsize=(6, 4), facecolor=self.colors['graph_bg'])
         self.usage_ax = self.usage_fig.add_subplot(111, facecolor=self.colors['graph_bg'])
         self.usage_canvas = FigureCanvasTkAgg(self.usage_fig, self.data_usage_window)
         self.usage_canvas_widget = self.usage_canvas.get_tk_widget()
         self.usage_canvas_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
+        self._usage_artists = {'timeframe': None, 'dl': None, 'ul': None}  # Fresh axes, no reusable bars
         self.update_data_usage_graph()
         self.data_usage_window.protocol("WM_DELETE_WINDOW", self.close_data_usage_window)
 
@@ -978,8 +1444,15 @@ class SmoothNetMonitor:
             self.data_usage_window = None
 
     def update_data_usage_graph(self, event=None):
+        if not (self.data_usage_window and tk.Toplevel.winfo_exists(self.data_usage_window)):
+            return  # Window closed or never opened; nothing visible to draw
+        if self.data_usage_window.state() == 'withdrawn':
+            return  # Hidden (e.g. minimized to tray); skip the redraw entirely
         timeframe = self.timeframe_var.get()
-        self.usage_ax.clear()
+        rebuild = self._usage_artists['timeframe'] != timeframe
+        if rebuild:
+            self.usage_ax.clear()
+            self._usage_artists = {'timeframe': None, 'dl': None, 'ul': None}
 
         if timeframe == "Hourly":
             self.plot_hourly_usage()
@@ -990,70 +1463,107 @@ class SmoothNetMonitor:
         elif timeframe == "Monthly":
             self.plot_monthly_usage()
 
-        self.usage_ax.set_facecolor(self.colors['graph_bg'])
-        self.usage_fig.patch.set_facecolor(self.colors['graph_bg'])
-        self.usage_ax.tick_params(axis='x', colors=self.colors['scale_color'])
-        self.usage_ax.tick_params(axis='y', colors=self.colors['scale_color'])
-        self.usage_ax.set_title(f"{timeframe} Data Usage", fontsize=self.graph_title_font_size, color=self.graph_text_color)
-        self.usage_ax.set_xlabel("Time", color=self.colors['text'])
-        self.usage_ax.set_ylabel("Data Usage", color=self.colors['text'])
-        self.usage_ax.legend(loc="upper right", fontsize=8, facecolor=self.colors['graph_bg'], edgecolor=self.colors['text'], labelcolor=self.colors['text'])
+        if rebuild:
+            # Static styling only needs re-applying when the axes were cleared
+            self.usage_ax.set_facecolor(self.colors['graph_bg'])
+            self.usage_fig.patch.set_facecolor(self.colors['graph_bg'])
+            self.usage_ax.tick_params(axis='x', colors=self.colors['scale_color'])
+            self.usage_ax.tick_params(axis='y', colors=self.colors['scale_color'])
+            self.usage_ax.set_title(f"{timeframe} Data Usage", fontsize=self.graph_title_font_size, color=self.graph_text_color)
+            self.usage_ax.set_xlabel("Time", color=self.colors['text'])
+            self.usage_ax.set_ylabel("Data Usage", color=self.colors['text'])
+            self.usage_ax.legend(loc="upper right", fontsize=8, facecolor=self.colors['graph_bg'], edgecolor=self.colors['text'], labelcolor=self.colors['text'])
+        self.usage_ax.relim()
+        self.usage_ax.autoscale_view()
         self.usage_canvas.draw_idle()
 
+    def _load_daily_table(self):
+        # One pass over the CSV into a date-keyed dict, cached on the file's
+        # (mtime, size) so repeated redraws and timeframe switches skip the
+        # read entirely; last row per date wins (append-only file)
+        try:
+            st = os.stat(self.data_usage_file)
+            key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return {}
+        if self._daily_table_cache is not None and self._daily_table_key == key:
+            return self._daily_table_cache
+        table = {}
+        try:
+            with open(self.data_usage_file, 'r', newline='') as csvfile:
+                reader = csv.reader(csvfile)
+                next(reader, None)  # Skip header
+                for row in reader:
+                    if len(row) >= 3:
+                        table[row[0]] = (int(row[1]), int(row[2]))
+        except Exception as e:
+            print(f"Error loading daily data table: {e}")
+        self._daily_table_cache = table
+        self._daily_table_key = key
+        return table
+
     def plot_daily_usage_graph(self):
         dates = []
         download_values = []
         upload_values = []
         today = datetime.date.today()
+        table = self._load_daily_table()
         for i in range(7):
-            date = today - datetime.timedelta(days=i)
-            dates.append(date.strftime('%Y-%m-%d'))
-            daily_data = self.load_data_for_date(date)
-            download_values.append(daily_data['download'])
-            upload_values.append(daily_data['upload'])
+            date_str = (today - datetime.timedelta(days=i)).strftime('%Y-%m-%d')
+            dates.append(date_str)
+            download_bytes, upload_bytes = table.get(date_str, (0, 0))
+            download_values.append(download_bytes / (1024*1024))
+            upload_values.append(upload_bytes / (1024*1024))
         dates.reverse()
         download_values.reverse()
         upload_values.reverse()
 
+        arts = self._usage_artists
+        if arts['timeframe'] == 'Daily':
+            # Same bars, new heights; no artist churn
+            for rect, value in zip(arts['dl'], download_values):
+                rect.set_height(value)
+            for rect, value in zip(arts['ul'], upload_values):
+                rect.set_height(value)
+            return
+
         x_positions = range(len(dates))
         width = 0.35
 
-        self.usage_ax.bar([pos - width/2 for pos in x_positions], download_values, width, label='Download', color=self.colors['download'])
-        self.usage_ax.bar([pos + width/2 for pos in x_positions], upload_values, width, label='Upload', color=self.colors['upload'])
+        arts['dl'] = self.usage_ax.bar([pos - width/2 for pos in x_positions], download_values, width, label='Download', color=self.colors['download'])
+        arts['ul'] = self.usage_ax.bar([pos + width/2 for pos in x_positions], upload_values, width, label='Upload', color=self.colors['upload'])
+        arts['timeframe'] = 'Daily'
 
         self.usage_ax.set_xticks(x_positions)
         self.usage_ax.set_xticklabels([date.split('-')[2] for date in dates])
 
     def load_data_for_date(self, date):
-        download_bytes = 0
-        upload_bytes = 0
-        date_str = date.strftime('%Y-%m-%d')
-        if os.path.exists(self.data_usage_file):
-            try:
-                with open(self.data_usage_file, 'r', newline='') as csvfile:
-                    reader = csv.DictReader(csvfile)
-                    for row in reader:
-                        if row['Date'] == date_str:
-                            download_bytes = int(row['DownloadBytes'])
-                            upload_bytes = int(row['UploadBytes'])
-                            break
-            except Exception as e:
-                print(f"Error loading data for date {date_str}: {e}")
+        download_bytes, upload_bytes = self._load_daily_table().get(date.strftime('%Y-%m-%d'), (0, 0))
         return {'download': download_bytes / (1024*1024), 'upload': upload_bytes / (1024*1024)}
 
     def plot_hourly_usage(self):
-        hours = list(range(24))
-        download_usage = [self.hourly_data[hour]['download'] / (1024*1024) for hour in hours]
-        upload_usage = [self.hourly_data[hour]['upload'] / (1024*1024) for hour in hours]
+        # Vectorized bytes-to-MB conversion straight off the hourly arrays
+        download_usage = self._hourly_dl.astype(np.float32) * (1.0 / 1048576)
+        upload_usage = self._hourly_ul.astype(np.float32) * (1.0 / 1048576)
+
+        arts = self._usage_artists
+        if arts['timeframe'] == 'Hourly':
+            # Same bars, new heights; no artist churn
+            for rect, value in zip(arts['dl'], download_usage):
+                rect.set_height(value)
+            for rect, value in zip(arts['ul'], upload_usage):
+                rect.set_height(value)
+            return
 
-        x_positions = range(len(hours))
+        x_positions = np.arange(24)
         width = 0.35
 
-        self.usage_ax.bar([pos - width/2 for pos in x_positions], download_usage, width, label='Download', color=self.colors['download'])
-        self.usage_ax.bar([pos + width/2 for pos in x_positions], upload_usage, width, label='Upload', color=self.colors['upload'])
+        arts['dl'] = self.usage_ax.bar(x_positions - width/2, download_usage, width, label='Download', color=self.colors['download'])
+        arts['ul'] = self.usage_ax.bar(x_positions + width/2, upload_usage, width, label='Upload', color=self.colors['upload'])
+        arts['timeframe'] = 'Hourly'
 
         self.usage_ax.set_xticks(x_positions)
-        self.usage_ax.set_xticklabels([f"{hour:02d}:00" for hour in hours])
+        self.usage_ax.set_xticklabels([f"{hour:02d}:00" for hour in range(24)])
 
     def plot_weekly_usage(self):
         messagebox.showinfo("Info", "Weekly data usage graph will be implemented in a future update.")
@@ -1071,24 +1581,25 @@ class SmoothNetMonitor:
                         hour = int(row['Hour'])
                         download_bytes = int(row['DownloadBytes'])
                         upload_bytes = int(row['UploadBytes'])
-                        self.hourly_data[hour]['download'] = download_bytes
-                        self.hourly_data[hour]['upload'] = upload_bytes
+                        self._hourly_dl[hour] = download_bytes
+                        self._hourly_ul[hour] = upload_bytes
             except Exception as e:
                 print(f"Error loading hourly data: {e}")
 
     def save_hourly_data(self):
+        # Snapshot the counters here; the actual write happens on the writer thread
+        rows = [(hour, int(self._hourly_dl[hour]), int(self._hourly_ul[hour])) for hour in range(24)]
+        self._io_queue.put((self._write_hourly_rows, (rows,)))
+
+    def _write_hourly_rows(self, rows):
         hourly_data_file = "hourly_usage.csv"
         try:
             with open(hourly_data_file, 'w', newline='') as csvfile:
-                fieldnames = ['Hour', 'DownloadBytes', 'UploadBytes']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                for hour in range(24):
-                    writer.writerow({
-                        'Hour': hour,
-                        'DownloadBytes': str(self.hourly_data[hour]['download']),
-                        'UploadBytes': str(self.hourly_data[hour]['upload'])
-                    })
+                # Rows are already positional tuples; a plain writer with one
+                # writerows call beats building a dict per row for DictWriter
+                writer = csv.writer(csvfile)
+                writer.writerow(['Hour', 'DownloadBytes', 'UploadBytes'])
+                writer.writerows(rows)
         except Exception as e:
             print(f"Error saving hourly data: {e}")
 